@@ -7,7 +7,6 @@ import threading
 import socket
 from pathlib import Path
 
-import inquirer
 from appdirs import user_data_dir
 from agentstack import log
 
@@ -91,6 +90,7 @@ def start_auth_server():
 
 def login():
     """Log in to AgentStack"""
+    import inquirer
     try:
         # check if already logged in
         token = get_stored_token()
@@ -1,7 +1,5 @@
 from typing import Optional
 import os, sys
-from art import text2art
-import inquirer
 from agentstack import conf, log
 from agentstack.conf import ConfigFile
 from agentstack.exceptions import ValidationError
@@ -22,21 +20,33 @@ PREFERRED_MODELS = [
     'anthropic/claude-3-opus',
 ]
 
+# rendered with `art.text2art("AgentStack", font="smisome1")`
+WELCOME_TITLE = '\n'.join([
+    '    ___       ___       ___       ___       ___       ___       ___       ___       ___       ___   ',
+    '   /\\  \\     /\\  \\     /\\  \\     /\\__\\     /\\  \\     /\\  \\     /\\  \\     /\\  \\     /\\  \\     /\\__\\  ',
+    '  /::\\  \\   /::\\  \\   /::\\  \\   /:| _|_    \\:\\  \\   /::\\  \\    \\:\\  \\   /::\\  \\   /::\\  \\   /:/ _/_ ',
+    ' /::\\:\\__\\ /:/\\:\\__\\ /::\\:\\__\\ /::|/\\__\\   /::\\__\\ /\\:\\:\\__\\   /::\\__\\ /::\\:\\__\\ /:/\\:\\__\\ /::-"\\__\\',
+    ' \\/\\::/  / \\:\\:\\/__/ \\:\\:\\/  / \\/|::/  /  /:/\\/__/ \\:\\:\\/__/  /:/\\/__/ \\/\\::/  / \\:\\ \\/__/ \\;:;-",-"',
+    '   /:/  /   \\::/  /   \\:\\/  /    |:/  /   \\/__/     \\::/  /   \\/__/      /:/  /   \\:\\__\\    |:|  |  ',
+    '   \\/__/     \\/__/     \\/__/     \\/__/               \\/__/               \\/__/     \\/__/     \\|__|  ',
+    '',
+])
+WELCOME_TAGLINE = "The easiest way to build a robust agent application!"
+
 
 def welcome_message():
-    title = text2art("AgentStack", font="smisome1")
-    tagline = "The easiest way to build a robust agent application!"
-    border = "-" * len(tagline)
+    border = "-" * len(WELCOME_TAGLINE)
 
     # Print the welcome message with ASCII art
-    log.info(title)
+    log.info(WELCOME_TITLE)
     log.info(border)
-    log.info(tagline)
+    log.info(WELCOME_TAGLINE)
     log.info(border)
 
 
 def undo() -> None:
     """Undo the last committed changes."""
+    import inquirer
     conf.assert_project()
     
     changed_files = repo.get_uncommitted_files()
@@ -56,6 +66,7 @@ def undo() -> None:
 
 def configure_default_model():
     """Set the default model"""
+    import inquirer
     agentstack_config = ConfigFile()
     if agentstack_config.default_model:
         log.debug("Using default model from project config.")
@@ -91,10 +102,14 @@ def get_validated_input(
         min_length: Minimum length requirement (0 for no requirement)
         snake_case: Whether to enforce snake_case naming
     """
+    import inquirer
+    if validate_func is None and min_length:
+        validate_func = validator_not_empty(min_length)
+
     while True:
         value = inquirer.text(
             message=message,
-            validate=validate_func or validator_not_empty(min_length) if min_length else None,
+            validate=validate_func,
         )
         if snake_case and not is_snake_case(value):
             raise ValidationError("Input must be in snake_case")
@@ -108,9 +123,8 @@ def parse_insertion_point(position: Optional[str] = None) -> Optional[InsertionP
     if position is None:
         return None  # defer assumptions
 
-    valid_positions = {x.value for x in InsertionPoint}
-    if position not in valid_positions:
-        raise ValueError(f"Position must be one of {','.join(valid_positions)}.")
-
-    return next(x for x in InsertionPoint if x.value == position)
+    try:
+        return InsertionPoint(position)  # lookup by value
+    except ValueError:
+        raise ValueError(f"Position must be one of {','.join(x.value for x in InsertionPoint)}.")
 
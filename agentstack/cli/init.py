@@ -1,7 +1,6 @@
 import os, sys
 from typing import Optional
 from pathlib import Path
-import inquirer
 from textwrap import shorten
 
 from agentstack import conf, log
@@ -38,6 +37,7 @@ def require_uv():
 
 def prompt_slug_name() -> str:
     """Prompt the user for a project name."""
+    import inquirer
     
     def _validate(slug_name: Optional[str]) -> bool:
         if not slug_name:
@@ -73,6 +73,7 @@ def prompt_slug_name() -> str:
 
 def select_template(slug_name: str, framework: Optional[str] = None) -> TemplateConfig:
     """Let the user select a template from the ones available."""
+    import inquirer
     templates: list[TemplateConfig] = get_all_templates()
 
     EMPTY = 'empty'
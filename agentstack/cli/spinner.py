@@ -81,7 +81,7 @@ class Spinner:
         Skips printing if message is the same as the last message printed."""
         with self._lock:
             # Skip if message is same as last one
-            if hasattr(self, '_last_message') and self._last_message == message:
+            if self._last_message == message:
                 return
 
             self._clear_line()
@@ -2,6 +2,8 @@ from typing import Optional
 from datetime import datetime
 import json
 import shutil
+import tempfile
+from pathlib import Path
 from cookiecutter.main import cookiecutter
 
 from agentstack import conf, log
@@ -52,17 +54,21 @@ def insert_template(name: str, template: TemplateConfig, framework: Optional[str
         framework=framework,
     )
 
-    template_path = get_package_path() / f'frameworks/templates/{framework}'
-    with open(f"{template_path}/cookiecutter.json", "w") as json_file:
-        json.dump(cookiecutter_data.to_dict(), json_file)
-        # TODO this should not be written to the package directory
+    package_template_path = get_package_path() / f'frameworks/templates/{framework}'
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # render from a copy of the template so we don't write to the package directory;
+        # this also keeps concurrent `init`s from overwriting each other's data.
+        template_path = Path(temp_dir) / framework
+        shutil.copytree(package_template_path, template_path)
+        with open(f"{template_path}/cookiecutter.json", "w") as json_file:
+            json.dump(cookiecutter_data.to_dict(), json_file)
 
-    # copy .env.example to .env
-    shutil.copy(
-        f'{template_path}/{"{{cookiecutter.project_metadata.project_slug}}"}/.env.example',
-        f'{template_path}/{"{{cookiecutter.project_metadata.project_slug}}"}/.env',
-    )
-    cookiecutter(str(template_path), no_input=True, extra_context=None)
+        # copy .env.example to .env
+        shutil.copy(
+            f'{template_path}/{"{{cookiecutter.project_metadata.project_slug}}"}/.env.example',
+            f'{template_path}/{"{{cookiecutter.project_metadata.project_slug}}"}/.env',
+        )
+        cookiecutter(str(template_path), no_input=True, extra_context=None)
 
 
 def export_template(output_filename: str):
@@ -1,7 +1,6 @@
 from typing import Optional
 import itertools
 from difflib import get_close_matches
-import inquirer
 from agentstack import conf, log
 from agentstack.utils import term_color, is_snake_case
 from agentstack import generation
@@ -62,6 +61,7 @@ def add_tool(tool_name: Optional[str], agents=Optional[list[str]]):
         - add the tool to the user's project
         - add the tool to the specified agents or all agents if none are specified
     """
+    import inquirer
     conf.assert_project()
 
     all_tool_names = get_all_tool_names()
@@ -1,9 +1,7 @@
 from typing import Optional
 import os
 import time
-import inquirer
 import webbrowser
-from art import text2art
 from agentstack import log
 from agentstack.frameworks import SUPPORTED_FRAMEWORKS
 from agentstack.utils import open_json_file, is_snake_case
@@ -73,6 +71,7 @@ def run_wizard(slug_name: str) -> TemplateConfig:
 
 
 def ask_framework() -> str:
+    import inquirer
     framework = inquirer.list_input(
         message="What agent framework do you want to use?",
         choices=SUPPORTED_FRAMEWORKS,
@@ -97,6 +96,7 @@ def ask_framework() -> str:
 
 
 def ask_agent_details():
+    import inquirer
     agent = {}
 
     agent['name'] = get_validated_input(
@@ -117,6 +117,7 @@ def ask_agent_details():
 
 
 def ask_task_details(agents: list[dict]) -> dict:
+    import inquirer
     task = {}
 
     task['name'] = get_validated_input(
@@ -139,6 +140,8 @@ def ask_task_details(agents: list[dict]) -> dict:
 
 
 def ask_design() -> dict:
+    import inquirer
+    from art import text2art
     use_wizard = inquirer.confirm(
         message="Would you like to use the CLI wizard to set up agents and tasks?",
     )
@@ -196,6 +199,7 @@ First we need to create the agents that will work together to accomplish tasks:
 
 
 def ask_tools() -> list:
+    import inquirer
     use_tools = inquirer.confirm(
         message="Do you want to add agent tools now? (you can do this later with `agentstack tools add <tool_name>`)",
     )
@@ -241,6 +245,7 @@ def ask_tools() -> list:
 
 
 def ask_project_details(slug_name: Optional[str] = None) -> dict:
+    import inquirer
     name = inquirer.text(message="What's the name of your project (snake_case)", default=slug_name or '')
 
     if not is_snake_case(name):
@@ -48,8 +48,7 @@ class Provider:
 
     def install_dependencies(self):
         """Install the dependencies for the provider."""
-        for dependency in self.dependencies:
-            packaging.install(dependency)
+        packaging.install_many(self.dependencies)
 
 
 class FrameworkModule(Protocol):
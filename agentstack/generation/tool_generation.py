@@ -21,8 +21,7 @@ def add_tool(name: str, agents: Optional[list[str]] = []):
         log.notify(f'Tool {name} is already installed')
     else:  # handle install
         if tool.dependencies:
-            for dependency in tool.dependencies:
-                packaging.install(dependency)
+            packaging.install_many(tool.dependencies)
 
         if tool.env:  # add environment variables which don't exist
             with EnvFile() as env:
@@ -110,8 +109,7 @@ def remove_tool(name: str, agents: Optional[list[str]] = []):
     # TODO ensure other agents are not using the tool
     tool = ToolConfig.from_tool_name(name)
     if tool.dependencies:
-        for dependency in tool.dependencies:
-            packaging.remove(dependency)
+        packaging.remove_many(tool.dependencies)
 
     # Edit the framework entrypoint file to exclude the tool in the agent definition
     if not agents:  # If no agents are specified, remove the tool from all agents
@@ -1,19 +1,32 @@
 import os, sys
 from typing import Optional, Callable
+from functools import lru_cache
 from pathlib import Path
 import re
+import codecs
+import shlex
+import asyncio
 import subprocess
-import select
 import site
 from packaging.requirements import Requirement
 from agentstack import conf, log
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # type: ignore  # not available on Windows
+
 
 DEFAULT_PYTHON_VERSION = "3.12"
 VENV_DIR_NAME: Path = Path(".venv")
 
 # filter uv output by these words to only show useful progress messages
 RE_UV_PROGRESS = re.compile(r'^(Resolved|Prepared|Installed|Uninstalled|Audited)')
+RE_VENV_PROGRESS = re.compile(r'^(Using|Creating)')
+
+# size we request for subprocess pipes so `uv` can write large bursts of output
+# without blocking on us; capped by the OS (ie. `/proc/sys/fs/pipe-max-size` on Linux)
+PIPE_BUFFER_SIZE = 1 << 20
 
 
 # When calling `uv` we explicitly specify the --python executable to use so that
@@ -31,9 +44,20 @@ def set_python_executable(path: str):
 
 def install(package: str):
     """Install a package with `uv` and add it to pyproject.toml."""
+    install_many([package])
+
+
+def install_many(packages: list[str]):
+    """
+    Install multiple packages with a single `uv` invocation and add them to
+    pyproject.toml. This lets `uv` resolve all of the packages at once.
+    """
     global _python_executable
     from agentstack.cli.spinner import Spinner
 
+    if not packages:
+        return
+
     def on_progress(line: str):
         if RE_UV_PROGRESS.match(line):
             spinner.clear_and_log(line.strip(), 'info')
@@ -41,9 +65,9 @@ def install(package: str):
     def on_error(line: str):
         log.error(f"uv: [error]\n {line.strip()}")
     
-    with Spinner(f"Installing {package}") as spinner:
+    with Spinner(f"Installing {', '.join(packages)}") as spinner:
         _wrap_command_with_callbacks(
-            [get_uv_bin(), 'add', '--python', _python_executable, package],
+            [get_uv_bin(), 'add', '--python', _python_executable, *packages],
             on_progress=on_progress,
             on_error=on_error,
         )
@@ -82,8 +106,15 @@ def install_project():
 
 def remove(package: str):
     """Uninstall a package with `uv`."""
-    # If `package` has been provided with a version, it will be stripped.
-    requirement = Requirement(package)
+    remove_many([package])
+
+
+def remove_many(packages: list[str]):
+    """Uninstall multiple packages with a single `uv` invocation."""
+    # If a package has been provided with a version, it will be stripped.
+    names = [Requirement(package).name for package in packages]
+    if not names:
+        return
 
     # TODO it may be worth considering removing unused sub-dependencies as well
     def on_progress(line: str):
@@ -93,9 +124,9 @@ def remove(package: str):
     def on_error(line: str):
         log.error(f"uv: [error]\n {line.strip()}")
 
-    log.info(f"Uninstalling {requirement.name}")
+    log.info(f"Uninstalling {', '.join(names)}")
     _wrap_command_with_callbacks(
-        [get_uv_bin(), 'remove', '--python', _python_executable, requirement.name],
+        [get_uv_bin(), 'remove', '--python', _python_executable, *names],
         on_progress=on_progress,
         on_error=on_error,
     )
@@ -128,11 +159,9 @@ def upgrade(package: str, use_venv: bool = True):
 
 def create_venv(python_version: str = DEFAULT_PYTHON_VERSION):
     """Initialize a virtual environment in the project directory of one does not exist."""
-    if os.path.exists(conf.PATH / VENV_DIR_NAME):
+    if (conf.PATH / VENV_DIR_NAME).is_dir():
         return  # venv already exists
 
-    RE_VENV_PROGRESS = re.compile(r'^(Using|Creating)')
-
     def on_progress(line: str):
         if RE_VENV_PROGRESS.match(line):
             log.info(line.strip())
@@ -147,8 +176,9 @@ def create_venv(python_version: str = DEFAULT_PYTHON_VERSION):
     )
 
 
+@lru_cache(maxsize=1)
 def get_uv_bin() -> str:
-    """Find the path to the uv binary."""
+    """Find the path to the uv binary. The result is cached for the life of the process."""
     try:
         import uv
 
@@ -158,59 +188,136 @@ def get_uv_bin() -> str:
 
 
 def _setup_env() -> dict[str, str]:
-    """Copy the current environment and add the virtual environment path for use by a subprocess."""
+    """Get the environment for use by a subprocess, with the virtual environment path added."""
+    return _build_env(str((conf.PATH / VENV_DIR_NAME).absolute()))
+
+
+@lru_cache(maxsize=1)
+def _build_env(venv_path: str) -> dict[str, str]:
+    """
+    Copy the current environment and add the virtual environment path.
+    Cached per `venv_path`, which only changes if `conf.PATH` does; the returned
+    dict is shared, so callers must not modify it.
+    """
     env = os.environ.copy()
-    env["VIRTUAL_ENV"] = str(conf.PATH / VENV_DIR_NAME.absolute())
+    env["VIRTUAL_ENV"] = venv_path
     env["UV_INTERNAL__PARENT_INTERPRETER"] = sys.executable
     return env
 
 
-def _wrap_command_with_callbacks(
+def _enlarge_pipe_buffer(fd: int) -> None:
+    """Grow the kernel buffer of a pipe where supported; silently keep the default otherwise."""
+    if not hasattr(fcntl, 'F_SETPIPE_SZ'):
+        return  # only available on Linux
+
+    try:
+        fcntl.fcntl(fd, fcntl.F_SETPIPE_SZ, PIPE_BUFFER_SIZE)
+    except OSError:
+        pass  # EPERM if we exceed the system limit for unprivileged users
+
+
+class _LineProtocol(asyncio.SubprocessProtocol):
+    """
+    Receives a subprocess' stdout and stderr as they arrive and queues them up one
+    complete line at a time. Partial lines are buffered per pipe until their newline
+    shows up. `None` is queued once both pipes have closed.
+    """
+
+    def __init__(self):
+        loop = asyncio.get_running_loop()
+        self.lines: asyncio.Queue[Optional[str]] = asyncio.Queue()
+        self.exited = loop.create_future()
+        self._decoders = {fd: codecs.getincrementaldecoder('utf-8')(errors='replace') for fd in (1, 2)}
+        self._residual = {fd: '' for fd in (1, 2)}
+
+    def connection_made(self, transport):
+        for fd in (1, 2):
+            pipe = transport.get_pipe_transport(fd)
+            if pipe:
+                _enlarge_pipe_buffer(pipe.get_extra_info('pipe').fileno())
+
+    def pipe_data_received(self, fd, data):
+        *lines, self._residual[fd] = (self._residual[fd] + self._decoders[fd].decode(data)).split('\n')
+        for line in lines:
+            self.lines.put_nowait(line + '\n')
+
+    def pipe_connection_lost(self, fd, exc):
+        residual = self._residual.pop(fd) + self._decoders[fd].decode(b'', final=True)
+        if residual:
+            self.lines.put_nowait(residual)
+        if not self._residual:  # all pipes closed
+            self.lines.put_nowait(None)
+
+    def process_exited(self):
+        self.exited.set_result(None)
+
+
+async def _wrap_command_with_callbacks_async(
     command: list[str],
     on_progress: Callable[[str], None] = lambda x: None,
     on_complete: Callable[[str], None] = lambda x: None,
     on_error: Callable[[str], None] = lambda x: None,
     use_venv: bool = True,
 ) -> bool:
-    """Run a command with progress callbacks. Returns bool for cmd success."""
-    process = None
+    """
+    Run a command with progress callbacks. Returns bool for cmd success.
+    Several commands can be run concurrently with `asyncio.gather`.
+    """
+    transport: Optional[asyncio.SubprocessTransport] = None
+    protocol: Optional[_LineProtocol] = None
     try:
-        all_lines = ''
+        all_lines: list[str] = []
         sub_args = {
             'cwd': conf.PATH.absolute(),
             'stdout': subprocess.PIPE,
             'stderr': subprocess.PIPE,
-            'text': True,
         }
         if use_venv:
             sub_args['env'] = _setup_env()
-        process = subprocess.Popen(command, **sub_args)  # type: ignore
-        assert process.stdout and process.stderr  # appease type checker
-
-        readable = [process.stdout, process.stderr]
-        while readable:
-            ready, _, _ = select.select(readable, [], [])
-            for fd in ready:
-                line = fd.readline()
-                if not line:
-                    readable.remove(fd)
-                    continue
-
-                on_progress(line)
-                all_lines += line
-
-        if process.wait() == 0:  # return code: success
-            on_complete(all_lines)
+        if conf.DEBUG:  # debug messages are filtered otherwise; don't build the string
+            log.debug("Running command: %s", shlex.join(command))
+        loop = asyncio.get_running_loop()
+        transport, protocol = await loop.subprocess_exec(
+            _LineProtocol,
+            *command,
+            stdin=None,  # inherit, like `subprocess.Popen`
+            **sub_args,  # type: ignore
+        )
+
+        while (line := await protocol.lines.get()) is not None:
+            on_progress(line)
+            all_lines.append(line)
+        await protocol.exited
+
+        if transport.get_returncode() == 0:  # return code: success
+            on_complete(''.join(all_lines))
             return True
         else:
-            on_error(all_lines)
+            on_error(''.join(all_lines))
             return False
     except Exception as e:
         on_error(str(e))
         return False
     finally:
-        if process:
-            try:
-                process.terminate()
-            except:
-                pass
+        if transport and protocol:
+            transport.close()  # terminates the process if we bailed out early
+            await protocol.exited
+
+
+def _wrap_command_with_callbacks(
+    command: list[str],
+    on_progress: Callable[[str], None] = lambda x: None,
+    on_complete: Callable[[str], None] = lambda x: None,
+    on_error: Callable[[str], None] = lambda x: None,
+    use_venv: bool = True,
+) -> bool:
+    """Run a command with progress callbacks. Returns bool for cmd success."""
+    return asyncio.run(
+        _wrap_command_with_callbacks_async(
+            command,
+            on_progress=on_progress,
+            on_complete=on_complete,
+            on_error=on_error,
+            use_venv=use_venv,
+        )
+    )
@@ -3,7 +3,6 @@ import os, sys
 import time
 from pathlib import Path
 from packaging.version import parse as parse_version, Version
-import inquirer
 from agentstack import conf, log
 from agentstack.utils import term_color, get_version, get_framework, get_base_dir
 from agentstack import packaging
@@ -109,6 +108,8 @@ def check_for_updates(update_requested: bool = False):
 
     installed_version: Version = parse_version(get_version(AGENTSTACK_PACKAGE))
     if latest_version > installed_version:
+        import inquirer  # defer import until we know we need it
+
         log.info('')  # newline
         if inquirer.confirm(
             f"New version of {AGENTSTACK_PACKAGE} available: {latest_version}! Do you want to install?"
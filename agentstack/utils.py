@@ -7,7 +7,6 @@ from importlib.metadata import version
 from pathlib import Path
 import importlib.resources
 from agentstack import conf
-from inquirer import errors as inquirer_errors
 from appdirs import user_data_dir
 
 
@@ -112,6 +111,7 @@ def is_snake_case(string: str):
 
 def validator_not_empty(min_length=1):
     def validator(_, answer):
+        from inquirer import errors as inquirer_errors
         if len(answer) < min_length:
             raise inquirer_errors.ValidationError(
                 '', reason=f"This field must be at least {min_length} characters long."
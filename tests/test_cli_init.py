@@ -3,6 +3,10 @@ import unittest
 from parameterized import parameterized
 from pathlib import Path
 import shutil
+import atexit
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from cli_test_utils import run_cli
 from agentstack import conf
 from agentstack import frameworks
@@ -11,6 +15,33 @@ from agentstack.templates import get_all_templates
 
 BASE_PATH = Path(__file__).parent
 
+_cleanup_threads: list[threading.Thread] = []
+
+
+@atexit.register
+def _wait_for_cleanup():
+    for thread in _cleanup_threads:
+        thread.join()
+
+
+def _rmtree_in_background(path: Path):
+    """Move `path` out of the way and delete it without blocking the next test."""
+    trash_path = path.with_name(f'{path.name}.trash.{uuid.uuid4().hex}')
+    try:
+        path.rename(trash_path)
+    except OSError:  # ie. does not exist, or is in use on Windows
+        shutil.rmtree(path, ignore_errors=True)
+        return
+
+    thread = threading.Thread(
+        target=shutil.rmtree,
+        args=(trash_path,),
+        kwargs={'ignore_errors': True},
+        daemon=True,
+    )
+    thread.start()
+    _cleanup_threads.append(thread)
+
 
 class CLIInitTest(unittest.TestCase):
     def setUp(self):
@@ -23,14 +54,24 @@ class CLIInitTest(unittest.TestCase):
         os.environ['PYTHONIOENCODING'] = 'utf-8'
 
     def tearDown(self):
-        shutil.rmtree(self.project_dir, ignore_errors=True)
-
-    @parameterized.expand([(template.name,) for template in get_all_templates()])
-    def test_init_command(self, template_name: str):
-        """Test the 'init' command to create a project directory."""
-        result = run_cli('init', 'test_project', '--template', template_name)
-        self.assertEqual(result.returncode, 0)
-        self.assertTrue((self.project_dir / 'test_project').exists())
+        _rmtree_in_background(self.project_dir)
+
+    def test_init_command(self):
+        """Test the 'init' command to create a project directory for each template."""
+        template_names = [template.name for template in get_all_templates()]
+
+        # every `init` runs in its own subprocess and project directory, so run them
+        # side by side; uv's package cache is shared between them.
+        def init(template_name: str):
+            return run_cli('init', f'test_project_{template_name}', '--template', template_name)
+
+        with ThreadPoolExecutor() as executor:
+            results = list(executor.map(init, template_names))
+
+        for template_name, result in zip(template_names, results):
+            with self.subTest(template=template_name):
+                self.assertEqual(result.returncode, 0)
+                self.assertTrue((self.project_dir / f'test_project_{template_name}').exists())
 
     @parameterized.expand([(k, v) for k, v in frameworks.ALIASED_FRAMEWORKS.items()])
     def test_init_command_aliased_framework_empty_project(self, alias: str, framework: str):